@@ -4,18 +4,147 @@ Command Line Interface for Password Analyzer and Wordlist Generator
 
 import sys
 import os
-from typing import List, Optional
+import heapq
+import itertools
+import time
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from typing import Dict, Iterable, Iterator, List, Optional, Tuple
 from password_analyzer import PasswordAnalyzer
 from wordlist_generator import WordlistGenerator
-from utils import format_analysis_output, get_user_input, validate_file_path
+from utils import _SEP60, format_analysis_output, get_user_input, parse_comma_separated, validate_file_path
+
+
+# Separator lines (_SEP60 is shared with utils)
+_SEP50 = "=" * 50
+_DASH50 = "-" * 50
+
+# Batch analysis tuning: passwords per work block and memoized analyses kept
+BATCH_BLOCK_SIZE = 10000
+BATCH_CACHE_SIZE = 200000
+READ_BUFFER_SIZE = 1 << 20
+WRITE_CHUNK_SIZE = 64 * 1024
+PROGRESS_INTERVAL = 0.5  # seconds between batch progress reports
+
+# Template for one record in the batch results file
+_RECORD_TMPL = (
+    "Password: %(p)s\n"
+    "Strength: %(lvl)s (%(s)d/100)\n"
+    "Entropy: %(e)s bits\n"
+    "Time to crack: %(t)s\n"
+    "%(pat)s"
+    "Recommendations: %(rec)s\n"
+    + _DASH50 + "\n"
+)
+
+# Per-process analyzer used by batch worker processes
+_ANALYZER = None
+
+
+def _init_worker():
+    """Build the analyzer once when a worker process starts"""
+    global _ANALYZER
+    _ANALYZER = PasswordAnalyzer()
+
+
+def _analyze_one(password: str) -> dict:
+    """Analyze a single password in a worker process"""
+    return _ANALYZER.analyze_password(password)
+
+
+def _read_passwords(path: str) -> Iterator[str]:
+    """Yield the stripped, non-blank lines of a password file"""
+    with open(path, 'r', encoding='utf-8', buffering=READ_BUFFER_SIZE) as f:
+        yield from filter(None, map(str.strip, f))
+
+
+def _chunked(iterable: Iterable, size: int) -> Iterator[list]:
+    """Split an iterable into lists of at most `size` items"""
+    iterator = iter(iterable)
+    while True:
+        block = list(itertools.islice(iterator, size))
+        if not block:
+            return
+        yield block
+
+
+def _section_header(title: str) -> str:
+    """Render a section title between two separator lines"""
+    return "\n".join(["\n" + _SEP60, title, _SEP60])
+
+
+class _BackgroundWriter:
+    """Collects text into large chunks and writes them from a background thread"""
+    
+    def __init__(self, f, chunk_size: int = WRITE_CHUNK_SIZE):
+        self.f = f
+        self.chunk_size = chunk_size
+        self._parts = []
+        self._size = 0
+        self._executor = ThreadPoolExecutor(max_workers=1)
+        self._pending = None
+    
+    def write(self, text: str):
+        self._parts.append(text)
+        self._size += len(text)
+        if self._size >= self.chunk_size:
+            self._flush()
+    
+    def _flush(self):
+        # Wait for the previous chunk so write errors surface and memory stays bounded
+        if self._pending:
+            self._pending.result()
+            self._pending = None
+        if self._parts:
+            data = "".join(self._parts)
+            self._parts = []
+            self._size = 0
+            self._pending = self._executor.submit(self.f.write, data)
+    
+    def close(self):
+        try:
+            self._flush()
+            if self._pending:
+                self._pending.result()
+        finally:
+            self._executor.shutdown()
+            self.f.close()
+    
+    def discard(self):
+        """Stop writing after a failure, dropping unwritten text and any further errors"""
+        self._parts = []
+        self._executor.shutdown()
+        try:
+            self.f.close()
+        except OSError:
+            pass
 
 
 class CLIInterface:
     """Command-line interface for the password analysis and wordlist generation tool"""
     
-    def __init__(self):
+    # Pre-rendered screens, each printed with a single call
+    _MENU = "\n".join([
+        _section_header("MAIN MENU"),
+        "1. Analyze Password Strength",
+        "2. Generate Custom Wordlist",
+        "3. Batch Analyze Passwords from File",
+        "4. Help",
+        "5. Exit",
+    ])
+    _ANALYSIS_HEADER = _section_header("PASSWORD STRENGTH ANALYSIS")
+    _WORDLIST_HEADER = "\n".join([
+        _section_header("CUSTOM WORDLIST GENERATION"),
+        "Provide personal information to generate a custom wordlist for security testing.",
+        "Leave fields empty if not applicable.\n",
+    ])
+    _BATCH_HEADER = _section_header("BATCH PASSWORD ANALYSIS")
+    _BATCH_RESULTS_HEADER = _section_header("BATCH ANALYSIS RESULTS")
+    
+    def __init__(self, jobs: int = 1):
         self.analyzer = PasswordAnalyzer()
         self.generator = WordlistGenerator()
+        self.jobs = jobs if jobs != 0 else (os.cpu_count() or 1)
         self.banner = """
 ╔══════════════════════════════════════════════════════════════╗
 ║           Password Strength Analyzer & Wordlist Generator    ║
@@ -29,14 +158,7 @@ class CLIInterface:
         print("===Welcome Choose an option===")
         
         while True:
-            print("\n" + "="*60)
-            print("MAIN MENU")
-            print("="*60)
-            print("1. Analyze Password Strength")
-            print("2. Generate Custom Wordlist")
-            print("3. Batch Analyze Passwords from File")
-            print("4. Help")
-            print("5. Exit")
+            print(self._MENU)
             
             choice = get_user_input("Enter your choice (1-5): ").strip()
             
@@ -63,9 +185,7 @@ class CLIInterface:
     
     def _interactive_password_analysis(self):
         """Interactive password analysis"""
-        print("\n" + "="*60)
-        print("PASSWORD STRENGTH ANALYSIS")
-        print("="*60)
+        print(self._ANALYSIS_HEADER)
         
         while True:
             password = get_user_input("\nEnter password to analyze (or 'back' to return): ", hide_input=True)
@@ -85,23 +205,24 @@ class CLIInterface:
     
     def _interactive_wordlist_generation(self):
         """Interactive wordlist generation"""
-        print("\n" + "="*60)
-        print("CUSTOM WORDLIST GENERATION")
-        print("="*60)
-        print("Provide personal information to generate a custom wordlist for security testing.")
-        print("Leave fields empty if not applicable.\n")
+        print(self._WORDLIST_HEADER)
         
         # Collect user inputs
         names_input = get_user_input("Names (comma-separated): ")
-        names = [name.strip() for name in names_input.split(',') if name.strip()]
+        names = parse_comma_separated(names_input)
         dates_input = get_user_input("Important dates/years (comma-separated): ")
-        dates = [date.strip() for date in dates_input.split(',') if date.strip()]
+        dates = parse_comma_separated(dates_input)
         
         pets_input = get_user_input("Pet names (comma-separated): ")
-        pets = [pet.strip() for pet in pets_input.split(',') if pet.strip()]
+        pets = parse_comma_separated(pets_input)
         
         interests_input = get_user_input("Interests/hobbies (comma-separated): ")
-        interests = [interest.strip() for interest in interests_input.split(',') if interest.strip()]
+        interests = parse_comma_separated(interests_input)
+        
+        # Validate inputs before asking for advanced options
+        if not any([names, dates, pets, interests]):
+            print("Error: At least one type of information must be provided.")
+            return
         
         # Advanced options
         print("\nAdvanced Options:")
@@ -126,11 +247,6 @@ class CLIInterface:
         if not output_file:
             output_file = "wordlist.txt"
         
-        # Validate inputs
-        if not any([names, dates, pets, interests]):
-            print("Error: At least one type of information must be provided.")
-            return
-        
         # Generate wordlist
         self.generate_wordlist(
             names=names,
@@ -146,9 +262,7 @@ class CLIInterface:
     
     def _batch_password_analysis(self):
         """Analyze passwords from a file"""
-        print("\n" + "="*60)
-        print("BATCH PASSWORD ANALYSIS")
-        print("="*60)
+        print(self._BATCH_HEADER)
         
         input_file = get_user_input("Enter path to password file: ").strip()
         
@@ -159,89 +273,145 @@ class CLIInterface:
         output_file = get_user_input("Output file for results (optional): ").strip()
         
         try:
-            with open(input_file, 'r', encoding='utf-8') as f:
-                passwords = [line.strip() for line in f if line.strip()]
+            # Count first so progress can be reported without holding the file in memory
+            total = sum(1 for _ in _read_passwords(input_file))
             
-            if not passwords:
+            if not total:
                 print("No passwords found in the file.")
                 return
             
-            print(f"\nAnalyzing {len(passwords)} passwords...")
+            print(f"\nAnalyzing {total} passwords...")
             
-            results = []
-            for i, password in enumerate(passwords, 1):
-                analysis = self.analyzer.analyze_password(password)
-                results.append((password, analysis))
-                
-                # Show progress for large files
-                if len(passwords) > 10 and i % max(1, len(passwords) // 10) == 0:
-                    print(f"Progress: {i}/{len(passwords)} ({i*100//len(passwords)}%)")
+            out = None
+            if output_file:
+                try:
+                    out = _BackgroundWriter(open(output_file, 'w', encoding='utf-8'))
+                    out.write("Password Analysis Results\n")
+                    out.write(_SEP50 + "\n\n")
+                except Exception as e:
+                    print(f"Error saving results: {str(e)}")
+            
+            count = 0
+            score_sum = 0
+            strength_counts = Counter()
+            weak_count = 0
+            weak_heap = []  # (-score, -index, password, analysis) for the 10 weakest
             
-            # Display summary
-            self._display_batch_results(results, output_file)
+            # Show progress for large files, throttled by wall time
+            show_progress = total > 10
+            next_report = time.monotonic() + PROGRESS_INTERVAL
+            
+            try:
+                passwords = _read_passwords(input_file)
+                for i, (password, analysis) in enumerate(self._analyze_passwords(passwords), 1):
+                    count = i
+                    score_sum += analysis['strength_score']
+                    strength_counts[analysis['strength_level']] += 1
+                    
+                    if analysis['strength_score'] < 40:
+                        weak_count += 1
+                        entry = (-analysis['strength_score'], -i, password, analysis)
+                        if len(weak_heap) < 10:
+                            heapq.heappush(weak_heap, entry)
+                        elif entry > weak_heap[0]:
+                            heapq.heapreplace(weak_heap, entry)
+                    
+                    if out:
+                        try:
+                            out.write(self._format_batch_record(password, analysis))
+                        except OSError as e:
+                            # Keep analyzing so the summary is still shown
+                            print(f"Error saving results: {str(e)}")
+                            out.discard()
+                            out = None
+                    
+                    if show_progress and time.monotonic() >= next_report:
+                        print(f"Progress: {i}/{total} ({i*100//total}%)", flush=True)
+                        next_report = time.monotonic() + PROGRESS_INTERVAL
+            finally:
+                if out:
+                    try:
+                        out.close()
+                    except OSError as e:
+                        print(f"Error saving results: {str(e)}")
+                        out = None
+            
+            # Display summary, weakest first (earliest first among equal scores)
+            weak_passwords = [(pwd, analysis) for _, _, pwd, analysis in sorted(weak_heap, reverse=True)]
+            self._display_batch_results(count, score_sum, strength_counts, weak_count, weak_passwords)
+            
+            if out:
+                print(f"\nDetailed results saved to: {output_file}")
             
         except Exception as e:
             print(f"Error processing file: {str(e)}")
     
-    def _display_batch_results(self, results: List[tuple], output_file: Optional[str]):
+    def _analyze_passwords(self, passwords: Iterable[str]) -> Iterator[Tuple[str, dict]]:
+        """
+        Yield (password, analysis) pairs in input order
+        
+        Passwords are read in fixed-size blocks so memory stays bounded, and
+        each distinct password within the memo window is analyzed only once.
+        """
+        executor = ProcessPoolExecutor(max_workers=self.jobs, initializer=_init_worker) if self.jobs > 1 else None
+        cache = {}
+        
+        try:
+            for block in _chunked(passwords, BATCH_BLOCK_SIZE):
+                if len(cache) >= BATCH_CACHE_SIZE:
+                    cache.clear()
+                
+                unique = [pwd for pwd in dict.fromkeys(block) if pwd not in cache]
+                if executor and len(unique) > 1:
+                    chunksize = max(1, len(unique) // (self.jobs * 4))
+                    analyses = executor.map(_analyze_one, unique, chunksize=chunksize)
+                else:
+                    analyses = self.analyzer.analyze_passwords(unique)
+                cache.update(zip(unique, analyses))
+                
+                for password in block:
+                    yield password, cache[password]
+        finally:
+            if executor:
+                executor.shutdown()
+    
+    def _format_batch_record(self, password: str, analysis: dict) -> str:
+        """Format the detailed analysis of one password for the results file"""
+        patterns = analysis['patterns_found']
+        return _RECORD_TMPL % {
+            'p': password,
+            'lvl': analysis['strength_level'],
+            's': analysis['strength_score'],
+            'e': analysis['entropy'],
+            't': analysis['time_to_crack'],
+            'pat': "Patterns: " + ", ".join(patterns) + "\n" if patterns else "",
+            'rec': "; ".join(analysis['recommendations']),
+        }
+    
+    def _display_batch_results(self, total: int, score_sum: int, strength_counts: Dict[str, int],
+                               weak_count: int, weak_passwords: List[tuple]):
         """Display batch analysis results"""
-        if not results:
+        if not total:
             return
         
-        # Calculate statistics
-        scores = [analysis['strength_score'] for _, analysis in results]
-        avg_score = sum(scores) / len(scores)
-        
-        strength_counts = {}
-        for _, analysis in results:
-            level = analysis['strength_level']
-            strength_counts[level] = strength_counts.get(level, 0) + 1
+        avg_score = score_sum / total
         
         # Display summary
-        print(f"\n" + "="*60)
-        print("BATCH ANALYSIS RESULTS")
-        print("="*60)
-        print(f"Total passwords analyzed: {len(results)}")
+        print(self._BATCH_RESULTS_HEADER)
+        print(f"Total passwords analyzed: {total}")
         print(f"Average strength score: {avg_score:.1f}/100")
         print(f"\nStrength distribution:")
         for level, count in sorted(strength_counts.items()):
-            percentage = (count / len(results)) * 100
+            percentage = (count / total) * 100
             print(f"  {level}: {count} ({percentage:.1f}%)")
         
         # Show weakest passwords
-        weak_passwords = [(pwd, analysis) for pwd, analysis in results 
-                         if analysis['strength_score'] < 40]
-        
         if weak_passwords:
-            print(f"\nWeakest passwords ({len(weak_passwords)} found):")
-            for i, (pwd, analysis) in enumerate(weak_passwords[:10], 1):
+            print(f"\nWeakest passwords ({weak_count} found):")
+            for i, (pwd, analysis) in enumerate(weak_passwords, 1):
                 print(f"  {i}. '{pwd}' - {analysis['strength_level']} ({analysis['strength_score']}/100)")
-            if len(weak_passwords) > 10:
-                print(f"  ... and {len(weak_passwords) - 10} more")
-        
-        # Save detailed results if requested
-        if output_file:
-            try:
-                with open(output_file, 'w', encoding='utf-8') as f:
-                    f.write("Password Analysis Results\n")
-                    f.write("=" * 50 + "\n\n")
-                    
-                    for password, analysis in results:
-                        f.write(f"Password: {password}\n")
-                        f.write(f"Strength: {analysis['strength_level']} ({analysis['strength_score']}/100)\n")
-                        f.write(f"Entropy: {analysis['entropy']} bits\n")
-                        f.write(f"Time to crack: {analysis['time_to_crack']}\n")
-                        
-                        if analysis['patterns_found']:
-                            f.write(f"Patterns: {', '.join(analysis['patterns_found'])}\n")
-                        
-                        f.write(f"Recommendations: {'; '.join(analysis['recommendations'])}\n")
-                        f.write("-" * 50 + "\n")
-                
-                print(f"\nDetailed results saved to: {output_file}")
-                
-            except Exception as e:
-                print(f"Error saving results: {str(e)}")
+            if weak_count > 10:
+                print(f"  ... and {weak_count - 10} more")
     
     def _show_help(self):
         """Display help information"""
@@ -283,14 +453,21 @@ For more examples, run: python main.py --help
         
         input("\nPress Enter to continue...")
     
-    def analyze_password(self, password: str):
-        """Analyze a single password and display results"""
+    def analyze_password(self, password: str, analysis: Optional[dict] = None):
+        """
+        Analyze a single password and display results
+        
+        Args:
+            password: Password to analyze
+            analysis: Precomputed analysis to display instead of re-analyzing
+        """
         if not password:
             print("Error: Password cannot be empty.")
             return
         
-        print(f"\nAnalyzing password...")
-        analysis = self.analyzer.analyze_password(password)
+        if analysis is None:
+            print(f"\nAnalyzing password...")
+            analysis = self.analyzer.analyze_password(password)
         format_analysis_output(analysis)
     
     def generate_wordlist(self, names: List[str] = None, dates: List[str] = None,
@@ -322,7 +499,7 @@ For more examples, run: python main.py --help
         print(f"Max words: {max_words}")
         
         # Generate wordlist
-        wordlist = self.generator.generate_wordlist(
+        words = self.generator.iter_wordlist(
             names=names or [],
             dates=dates or [],
             pets=pets or [],
@@ -330,33 +507,60 @@ For more examples, run: python main.py --help
             include_years=include_years,
             include_leet=include_leet,
             include_combinations=include_combinations,
-            max_words=max_words
+            max_words=max_words,
+            jobs=self.jobs
         )
         
-        if not wordlist:
+        first = next(words, None)
+        if first is None:
             print("Error: No words generated. Please check your input data.")
             return
         
-        # Display statistics
-        stats = self.generator.get_wordlist_stats(wordlist)
+        # Statistics and samples are collected while the words are exported
+        stats = {'total_words': 0, 'total_length': 0, 'min_length': len(first), 'max_length': 0}
+        samples = []
+        
+        def track(words):
+            for word in words:
+                length = len(word)
+                stats['total_words'] += 1
+                stats['total_length'] += length
+                if length < stats['min_length']:
+                    stats['min_length'] = length
+                if length > stats['max_length']:
+                    stats['max_length'] = length
+                if len(samples) < 10:
+                    samples.append(word)
+                yield word
+        
+        tracked = track(itertools.chain([first], words))
+        bytes_written = self.generator.export_wordlist(tracked, output_file)
+        
+        # A failed export may stop before consuming every word; finish the statistics
+        for _ in tracked:
+            pass
+        total_words = stats['total_words']
+        
+        # Display statistics (generated words are already unique)
         print(f"\nWordlist Statistics:")
-        print(f"  Total words: {stats['total_words']}")
-        print(f"  Average length: {stats['avg_length']}")
-        print(f"  Length range: {stats['min_length']}-{stats['max_length']}")
-        print(f"  Unique words: {stats['unique_words']}")
+        print(f"  Total words: {total_words}")
+        if total_words:
+            print(f"  Average length: {round(stats['total_length'] / total_words, 2)}")
+            print(f"  Length range: {stats['min_length']}-{stats['max_length']}")
+        print(f"  Unique words: {total_words}")
         
         # Show sample words
         print(f"\nSample words (first 10):")
-        for i, word in enumerate(wordlist[:10], 1):
+        for i, word in enumerate(samples, 1):
             print(f"  {i:2d}. {word}")
         
-        if len(wordlist) > 10:
-            print(f"  ... and {len(wordlist) - 10} more")
+        if total_words > 10:
+            print(f"  ... and {total_words - 10} more")
         
-        # Export to file
-        if self.generator.export_wordlist(wordlist, output_file):
+        # Export result
+        if bytes_written is not None:
             print(f"\n✓ Wordlist exported to: {output_file}")
-            print(f"  File size: {os.path.getsize(output_file)} bytes")
+            print(f"  File size: {bytes_written} bytes")
         else:
             print(f"\n✗ Failed to export wordlist to: {output_file}")
 
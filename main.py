@@ -6,8 +6,75 @@ Main entry point for both CLI and GUI interfaces
 
 import sys
 import argparse
-from cli_interface import CLIInterface
-from gui_interface import GUIInterface
+
+
+def _job_count(value: str) -> int:
+    """Parse --jobs, allowing 0 (all cores) but not negative counts"""
+    try:
+        jobs = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"invalid int value: {value!r}")
+    if jobs < 0:
+        raise argparse.ArgumentTypeError(f"must be 0 or a positive number, got {jobs}")
+    return jobs
+
+
+# Mode handlers import their interface lazily so CLI runs don't pay for GUI toolkits
+
+def _run_gui(args: argparse.Namespace) -> None:
+    """Launch GUI interface"""
+    from gui_interface import GUIInterface
+    gui = GUIInterface()
+    gui.run()
+
+
+def _run_analyze(args: argparse.Namespace) -> None:
+    """Analyze a single password (only needs the analyzer)"""
+    from password_analyzer import PasswordAnalyzer
+    from utils import format_analysis_output
+    
+    print(f"\nAnalyzing password...")
+    format_analysis_output(PasswordAnalyzer().analyze_password(args.analyze))
+
+
+def _run_wordlist(args: argparse.Namespace) -> None:
+    """Generate a wordlist from command line options"""
+    from cli_interface import CLIInterface
+    from utils import parse_comma_separated
+    
+    CLIInterface(jobs=args.jobs).generate_wordlist(
+        names=parse_comma_separated(args.name or ''),
+        dates=parse_comma_separated(args.dates or ''),
+        pets=parse_comma_separated(args.pets or ''),
+        interests=parse_comma_separated(args.interests or ''),
+        output_file=args.output or 'wordlist.txt',
+        max_words=args.max_words
+    )
+
+
+def _run_interactive(args: argparse.Namespace) -> None:
+    """Interactive CLI mode"""
+    from cli_interface import CLIInterface
+    CLIInterface(jobs=args.jobs).interactive_mode()
+
+
+MODE_HANDLERS = {
+    'gui': _run_gui,
+    'analyze': _run_analyze,
+    'wordlist': _run_wordlist,
+    'interactive': _run_interactive,
+}
+
+
+def _select_mode(args: argparse.Namespace) -> str:
+    """Pick the single mode requested by the parsed arguments"""
+    if args.gui:
+        return 'gui'
+    if args.analyze:
+        return 'analyze'
+    if args.generate_wordlist or any([args.name, args.dates, args.pets, args.interests]):
+        return 'wordlist'
+    return 'interactive'
 
 
 def main():
@@ -51,6 +118,10 @@ Examples:
     parser.add_argument('--max-words', type=int, default=10000,
                        help='Maximum number of words to generate (default: 10000)')
     
+    # Performance options
+    parser.add_argument('--jobs', '-j', type=_job_count, default=1, metavar='N',
+                       help='Worker processes for batch analysis and wordlist generation (default: 1, 0 = all cores)')
+    
     args = parser.parse_args()
     
     # Default to CLI if no interface specified
@@ -58,29 +129,7 @@ Examples:
         args.cli = True
     
     try:
-        if args.gui:
-            # Launch GUI interface
-            gui = GUIInterface()
-            gui.run()
-        else:
-            # Use CLI interface
-            cli = CLIInterface()
-            
-            if args.analyze:
-                cli.analyze_password(args.analyze)
-            elif args.generate_wordlist or any([args.name, args.dates, args.pets, args.interests]):
-                cli.generate_wordlist(
-                    names=args.name.split(',') if args.name else [],
-                    dates=args.dates.split(',') if args.dates else [],
-                    pets=args.pets.split(',') if args.pets else [],
-                    interests=args.interests.split(',') if args.interests else [],
-                    output_file=args.output or 'wordlist.txt',
-                    max_words=args.max_words
-                )
-            else:
-                # Interactive CLI mode
-                cli.interactive_mode()
-                
+        MODE_HANDLERS[_select_mode(args)](args)
     except KeyboardInterrupt:
         print("\n\nOperation cancelled by user.")
         sys.exit(0)
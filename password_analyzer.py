@@ -5,7 +5,29 @@ Implements custom entropy calculations and pattern detection
 
 import re
 import math
-from typing import Dict, List, Tuple, Any
+import bisect
+import string
+from typing import Dict, Iterable, List, Tuple, Any
+from utils import COMMON_PASSWORDS, calculate_entropy_simple, split_duration
+
+
+# Assumed attacker speed: 10^9 guesses per second (modern hardware)
+GUESSES_PER_SECOND = 1e9
+
+# Average crack time is 2^entropy / (2 * guesses per second); at or above
+# this entropy it exceeds 1000 years, so 2^entropy is never computed
+_CENTURIES_ENTROPY = math.log2(2 * GUESSES_PER_SECOND * 31536000000)
+
+# Flags returned by PasswordAnalyzer._detect_patterns alongside the descriptions
+PATTERN_REPEAT = 1
+PATTERN_KEYBOARD = 2
+PATTERN_LEET = 4
+PATTERN_YEAR = 8
+PATTERN_WEAK = 16
+
+# Strength levels; a score reaching _LEVEL_BOUNDS[i] moves up to _LEVELS[i + 1]
+_LEVEL_BOUNDS = [20, 40, 60, 80]
+_LEVELS = ["Very Weak", "Weak", "Moderate", "Strong", "Very Strong"]
 
 
 class PasswordAnalyzer:
@@ -33,12 +55,52 @@ class PasswordAnalyzer:
             'space': 1
         }
         
-        # Common weak passwords and patterns
-        self.weak_passwords = {
-            'password', '123456', 'password123', 'admin', 'qwerty',
-            'letmein', 'welcome', 'monkey', 'dragon', 'master',
-            'hello', 'login', 'pass', 'shadow', 'jordan'
+        # log2 of the combined charset size for every combination of sets,
+        # indexed by the bitmask returned from _identify_character_sets
+        self._charset_bits = {
+            'lowercase': 1,
+            'uppercase': 2,
+            'digits': 4,
+            'symbols': 8,
+            'space': 16
         }
+        self._log2_cs = []
+        for mask in range(32):
+            total = sum(size for cs, size in self.charset_sizes.items()
+                        if mask & self._charset_bits[cs])
+            self._log2_cs.append(math.log2(total) if total else 0.0)
+        
+        # Common weak passwords and patterns
+        self.weak_passwords = COMMON_PASSWORDS
+        
+        # Character classes for single-pass character set detection
+        self._LOWER = frozenset(string.ascii_lowercase)
+        self._UPPER = frozenset(string.ascii_uppercase)
+        self._DIGITS = frozenset(string.digits)
+        self._ALNUM = frozenset(string.ascii_letters + string.digits)
+        self._LEET = frozenset('@31057')  # Leetspeak stand-ins for a, e, i, o, s, t
+        
+        # Three-character runs of each keyboard row
+        keyboard_rows = ['qwertyuiop', 'asdfghjkl', 'zxcvbnm']
+        self._kb_row_trigrams = [
+            frozenset(row[i:i+3] for i in range(len(row) - 2)) for row in keyboard_rows
+        ]
+        
+        # Precompiled regular expressions
+        self._re_repeat = re.compile(r'(.)\1{2,}')
+        self._re_year = re.compile(r'(19|20)\d{2}')
+        
+        # Common patterns as (pattern, literal, regex). Literal patterns, and
+        # literals ending in '+' such as '123+' (which match exactly when the
+        # literal itself occurs), are checked with a substring test instead
+        # of a regex search.
+        self._common_checks = []
+        for pattern in self.common_patterns:
+            literal = pattern[:-1] if pattern.endswith('+') else pattern
+            if literal.isalnum():
+                self._common_checks.append((pattern, literal, None))
+            else:
+                self._common_checks.append((pattern, None, re.compile(pattern)))
     
     def analyze_password(self, password: str) -> Dict[str, Any]:
         """
@@ -64,13 +126,14 @@ class PasswordAnalyzer:
         
         # Basic metrics
         length = len(password)
-        character_sets = self._identify_character_sets(password)
-        entropy = self._calculate_entropy(password, character_sets)
-        patterns = self._detect_patterns(password)
+        character_sets, charset_mask = self._identify_character_sets(password)
+        entropy = self._calculate_entropy(password, charset_mask)
+        patterns, pattern_flags = self._detect_patterns(password, password.lower())
         
         # Calculate strength score (0-100)
         strength_score = self._calculate_strength_score(
-            length, character_sets, entropy, patterns, password
+            length, len(character_sets), entropy, len(patterns),
+            bool(pattern_flags & PATTERN_WEAK)
         )
         
         # Determine strength level
@@ -78,7 +141,7 @@ class PasswordAnalyzer:
         
         # Generate recommendations
         recommendations = self._generate_recommendations(
-            length, character_sets, patterns, password
+            length, character_sets, patterns, pattern_flags
         )
         
         # Estimate time to crack
@@ -95,151 +158,140 @@ class PasswordAnalyzer:
             'time_to_crack': time_to_crack
         }
     
-    def _identify_character_sets(self, password: str) -> List[str]:
-        """Identify which character sets are used in the password"""
+    def analyze_passwords(self, passwords: Iterable[str]) -> List[Dict[str, Any]]:
+        """
+        Analyze many passwords, e.g. a whole wordlist
+        
+        Each distinct password is analyzed once and repeats share its result.
+        
+        Args:
+            passwords: Passwords to analyze
+            
+        Returns:
+            List of analysis dictionaries, in input order
+        """
+        analyze = self.analyze_password
+        seen = {}
+        results = []
+        
+        for password in passwords:
+            analysis = seen.get(password)
+            if analysis is None:
+                analysis = seen[password] = analyze(password)
+            results.append(analysis)
+        
+        return results
+    
+    def _identify_character_sets(self, password: str) -> Tuple[List[str], int]:
+        """Identify which character sets are used in the password, as names and a bitmask"""
         sets_used = []
+        chars = set(password)
         
-        if re.search(r'[a-z]', password):
+        if not chars.isdisjoint(self._LOWER):
             sets_used.append('lowercase')
-        if re.search(r'[A-Z]', password):
+        if not chars.isdisjoint(self._UPPER):
             sets_used.append('uppercase')
-        if re.search(r'[0-9]', password):
+        if not chars.isdisjoint(self._DIGITS):
             sets_used.append('digits')
-        if re.search(r'[^a-zA-Z0-9\s]', password):
+        # Symbols are anything other than ASCII letters, digits and whitespace
+        if any(not c.isspace() for c in chars - self._ALNUM):
             sets_used.append('symbols')
-        if ' ' in password:
+        if ' ' in chars:
             sets_used.append('space')
+        
+        mask = 0
+        for cs in sets_used:
+            mask |= self._charset_bits[cs]
             
-        return sets_used
+        return sets_used, mask
     
-    def _calculate_entropy(self, password: str, character_sets: List[str]) -> float:
+    def _calculate_entropy(self, password: str, charset_mask: int) -> float:
         """
         Calculate password entropy using Shannon entropy formula
         
         Args:
             password: Password to analyze
-            character_sets: List of character sets used
+            charset_mask: Bitmask of character sets used
             
         Returns:
             Entropy value in bits
         """
-        if not password or not character_sets:
+        if not password or not charset_mask:
             return 0.0
         
-        # Calculate charset size
-        charset_size = sum(self.charset_sizes[cs] for cs in character_sets)
-        
-        # Basic entropy calculation: log2(charset_size^length)
-        basic_entropy = len(password) * math.log2(charset_size)
-        
-        # Adjust for character frequency (Shannon entropy)
-        char_counts = {}
-        for char in password:
-            char_counts[char] = char_counts.get(char, 0) + 1
-        
-        shannon_entropy = 0
-        for count in char_counts.values():
-            probability = count / len(password)
-            shannon_entropy -= probability * math.log2(probability)
-        
-        # Combine both metrics (weighted average)
-        combined_entropy = (basic_entropy * 0.7) + (shannon_entropy * len(password) * 0.3)
-        
-        return combined_entropy
+        # Weighted average of the charset entropy, log2(charset_size^length), and
+        # the Shannon entropy of the character frequencies, both per character
+        return len(password) * (0.7 * self._log2_cs[charset_mask]
+                                + 0.3 * calculate_entropy_simple(password))
     
-    def _detect_patterns(self, password: str) -> List[str]:
-        """Detect common weak patterns in password"""
+    def _detect_patterns(self, password: str, password_lower: str) -> Tuple[List[str], int]:
+        """Detect common weak patterns in password (and its lowercased form), as descriptions and PATTERN_* flags"""
         patterns_found = []
-        password_lower = password.lower()
+        flags = 0
         
         # Check for common patterns
-        for pattern in self.common_patterns:
-            if re.search(pattern, password_lower):
+        for pattern, literal, regex in self._common_checks:
+            if literal is not None:
+                found = literal in password_lower
+            else:
+                found = regex.search(password_lower)
+            if found:
                 patterns_found.append(f"Contains pattern: {pattern}")
         
         # Check for repetitive characters
-        if re.search(r'(.)\1{2,}', password):
+        if self._re_repeat.search(password):
             patterns_found.append("Repetitive characters")
+            flags |= PATTERN_REPEAT
         
-        # Check for keyboard patterns
-        keyboard_rows = ['qwertyuiop', 'asdfghjkl', 'zxcvbnm']
-        for row in keyboard_rows:
-            for i in range(len(row) - 2):
-                if row[i:i+3] in password_lower:
-                    patterns_found.append("Keyboard pattern detected")
-                    break
+        # Check for keyboard patterns (reported once per keyboard row used)
+        pw_trigrams = {password_lower[i:i+3] for i in range(len(password_lower) - 2)}
+        for row_trigrams in self._kb_row_trigrams:
+            if not row_trigrams.isdisjoint(pw_trigrams):
+                patterns_found.append("Keyboard pattern detected")
+                flags |= PATTERN_KEYBOARD
         
         # Check for common substitutions (leetspeak)
-        leet_patterns = {'@': 'a', '3': 'e', '1': 'i', '0': 'o', '5': 's', '7': 't'}
-        leet_count = sum(1 for char in password if char in leet_patterns)
-        if leet_count > 0:
+        if not self._LEET.isdisjoint(password):
             patterns_found.append("Leetspeak substitutions detected")
+            flags |= PATTERN_LEET
         
         # Check for dates
-        if re.search(r'(19|20)\d{2}', password):
+        if self._re_year.search(password):
             patterns_found.append("Contains year")
+            flags |= PATTERN_YEAR
         
         # Check for common weak passwords
         if password_lower in self.weak_passwords:
             patterns_found.append("Common weak password")
+            flags |= PATTERN_WEAK
         
-        return patterns_found
+        return patterns_found, flags
     
-    def _calculate_strength_score(self, length: int, character_sets: List[str], 
-                                entropy: float, patterns: List[str], password: str) -> int:
-        """Calculate overall strength score (0-100)"""
-        score = 0
-        
-        # Length scoring (40 points max)
-        if length >= 12:
-            score += 40
-        elif length >= 8:
-            score += 30
-        elif length >= 6:
-            score += 20
-        else:
-            score += length * 2
-        
-        # Character set diversity (30 points max)
-        charset_score = len(character_sets) * 7.5
-        score += min(charset_score, 30)
-        
-        # Entropy bonus (20 points max)
-        if entropy >= 60:
-            score += 20
-        elif entropy >= 40:
-            score += 15
-        elif entropy >= 25:
-            score += 10
-        else:
-            score += entropy / 4
-        
-        # Pattern penalties
-        pattern_penalty = len(patterns) * 5
-        score -= pattern_penalty
-        
-        # Special penalties for very weak passwords
-        if password.lower() in self.weak_passwords:
-            score -= 30
+    def _calculate_strength_score(self, length: int, charset_count: int, entropy: float,
+                                pattern_count: int, is_weak: bool) -> int:
+        """Calculate overall strength score (0-100) from scalar metrics"""
+        score = (
+            # Length scoring (40 points max)
+            (40 if length >= 12 else 30 if length >= 8 else 20 if length >= 6 else length * 2)
+            # Character set diversity (30 points max)
+            + min(charset_count * 7.5, 30)
+            # Entropy bonus (20 points max)
+            + (20 if entropy >= 60 else 15 if entropy >= 40 else 10 if entropy >= 25 else entropy / 4)
+            # Pattern penalties
+            - pattern_count * 5
+            # Special penalty for very weak passwords
+            - 30 * is_weak
+        )
         
         # Ensure score is within bounds
         return max(0, min(100, int(score)))
     
     def _get_strength_level(self, score: int) -> str:
         """Convert numeric score to descriptive strength level"""
-        if score >= 80:
-            return "Very Strong"
-        elif score >= 60:
-            return "Strong"
-        elif score >= 40:
-            return "Moderate"
-        elif score >= 20:
-            return "Weak"
-        else:
-            return "Very Weak"
+        return _LEVELS[bisect.bisect_right(_LEVEL_BOUNDS, score)]
     
     def _generate_recommendations(self, length: int, character_sets: List[str], 
-                                patterns: List[str], password: str) -> List[str]:
+                                patterns: List[str], pattern_flags: int) -> List[str]:
         """Generate specific recommendations for password improvement"""
         recommendations = []
         
@@ -259,14 +311,14 @@ class PasswordAnalyzer:
         
         if patterns:
             recommendations.append("Avoid predictable patterns")
-            if any("keyboard" in p.lower() for p in patterns):
+            if pattern_flags & PATTERN_KEYBOARD:
                 recommendations.append("Avoid keyboard patterns (qwerty, asdf, etc.)")
-            if any("repetitive" in p.lower() for p in patterns):
+            if pattern_flags & PATTERN_REPEAT:
                 recommendations.append("Avoid repetitive characters")
-            if any("year" in p.lower() for p in patterns):
+            if pattern_flags & PATTERN_YEAR:
                 recommendations.append("Avoid using years or dates")
         
-        if password.lower() in self.weak_passwords:
+        if pattern_flags & PATTERN_WEAK:
             recommendations.append("Avoid common passwords")
         
         if not recommendations:
@@ -279,25 +331,19 @@ class PasswordAnalyzer:
         if entropy <= 0:
             return "Instant"
         
-        # Assume 10^9 guesses per second (modern hardware)
-        guesses_per_second = 1e9
+        # Stay in log space for strong passwords, where 2^entropy can overflow
+        if entropy >= _CENTURIES_ENTROPY:
+            return "Centuries"
+        
         total_combinations = 2 ** entropy
-        seconds_to_crack = total_combinations / (2 * guesses_per_second)  # Average case
+        seconds_to_crack = total_combinations / (2 * GUESSES_PER_SECOND)  # Average case
         
-        if seconds_to_crack < 1:
+        duration = split_duration(seconds_to_crack)
+        if duration is None:
             return "Instant"
-        elif seconds_to_crack < 60:
-            return f"{int(seconds_to_crack)} seconds"
-        elif seconds_to_crack < 3600:
-            return f"{int(seconds_to_crack / 60)} minutes"
-        elif seconds_to_crack < 86400:
-            return f"{int(seconds_to_crack / 3600)} hours"
-        elif seconds_to_crack < 31536000:
-            return f"{int(seconds_to_crack / 86400)} days"
-        elif seconds_to_crack < 31536000000:
-            return f"{int(seconds_to_crack / 31536000)} years"
-        else:
-            return "Centuries"
+        
+        count, name = duration
+        return f"{count} {name}s"
 
 
 # Example usage and testing
@@ -2,10 +2,51 @@
 Utility functions for the Password Analyzer and Wordlist Generator
 """
 
+import io
 import os
 import sys
+import bisect
 import getpass
-from typing import Any, Dict
+from collections import Counter
+from itertools import chain
+from math import log2 as _log2
+from typing import Any, Dict, List, Optional, Tuple
+
+
+# Separator line for analysis output and CLI section headers
+_SEP60 = "=" * 60
+
+# Duration units as (seconds per unit, name), smallest first
+TIME_UNITS = [
+    (1, 'second'),
+    (60, 'minute'),
+    (3600, 'hour'),
+    (86400, 'day'),
+    (31536000, 'year')
+]
+_TIME_BOUNDS = [size for size, _ in TIME_UNITS]
+
+# File size units, each 1024 times the previous
+_SIZE_UNITS = ["B", "KB", "MB", "GB", "TB"]
+
+# Characters not allowed in filenames, all mapped to '_'
+_FILENAME_TABLE = str.maketrans({c: '_' for c in '<>:"/\\|?*'})
+
+# Terminal types known to support ANSI colors
+_COLOR_TERMS = frozenset({'xterm', 'xterm-256color', 'screen'})
+
+# Next backup counter to try for each base path, and the highest counter probed
+_backup_counters: Dict[str, int] = {}
+MAX_BACKUP_COUNTER = 10000
+
+# Common weak passwords, shared with PasswordAnalyzer
+COMMON_PASSWORDS = frozenset({
+    'password', '123456', '123456789', 'qwerty', 'abc123',
+    'password123', 'admin', 'letmein', 'welcome', 'monkey',
+    'dragon', 'master', 'hello', 'login', 'pass', 'shadow',
+    '12345', '1234', '12345678', 'football', 'baseball',
+    'trustno1', 'superman', 'batman', 'jordan', 'harley'
+})
 
 
 def format_analysis_output(analysis: Dict[str, Any]) -> str:
@@ -15,38 +56,41 @@ def format_analysis_output(analysis: Dict[str, Any]) -> str:
     Args:
         analysis: Dictionary containing analysis results
     """
-    print("\n" + "="*60)
-    print("PASSWORD ANALYSIS RESULTS")
-    print("="*60)
+    # Build the whole report first and write it to stdout in one call
+    buf = io.StringIO()
+    w = buf.write
+    
+    w(f"\n{_SEP60}\nPASSWORD ANALYSIS RESULTS\n{_SEP60}\n")
     
     # Basic metrics
-    print(f"Password Length: {analysis['length']} characters")
-    print(f"Character Sets: {', '.join(analysis['character_sets']) if analysis['character_sets'] else 'None'}")
-    print(f"Entropy: {analysis['entropy']} bits")
-    print(f"Time to Crack: {analysis['time_to_crack']}")
+    w(f"Password Length: {analysis['length']} characters\n")
+    w(f"Character Sets: {', '.join(analysis['character_sets']) if analysis['character_sets'] else 'None'}\n")
+    w(f"Entropy: {analysis['entropy']} bits\n")
+    w(f"Time to Crack: {analysis['time_to_crack']}\n")
     
     # Strength assessment with color coding if supported
     strength_level = analysis['strength_level']
     score = analysis['strength_score']
     strength_color = get_strength_color_code(score)
     
-    print(f"\n{strength_color}Strength: {strength_level} ({score}/100){get_reset_color()}")
+    w(f"\n{strength_color}Strength: {strength_level} ({score}/100){get_reset_color()}\n")
     
-    # Display strength bar
-    display_strength_bar(score)
+    # Strength bar
+    w(f"{render_strength_bar(score)}\n")
     
     # Security issues
     if analysis['patterns_found']:
-        print(f"\n⚠️  SECURITY ISSUES DETECTED:")
+        w("\n⚠️  SECURITY ISSUES DETECTED:\n")
         for i, pattern in enumerate(analysis['patterns_found'], 1):
-            print(f"   {i}. {pattern}")
+            w(f"   {i}. {pattern}\n")
     
     # Recommendations
-    print(f"\n💡 RECOMMENDATIONS:")
+    w("\n💡 RECOMMENDATIONS:\n")
     for i, recommendation in enumerate(analysis['recommendations'], 1):
-        print(f"   {i}. {recommendation}")
+        w(f"   {i}. {recommendation}\n")
     
-    print("="*60)
+    w(f"{_SEP60}\n")
+    sys.stdout.write(buf.getvalue())
 
 
 def display_strength_bar(score: int, width: int = 40) -> None:
@@ -57,6 +101,20 @@ def display_strength_bar(score: int, width: int = 40) -> None:
         score: Strength score (0-100)
         width: Width of the bar in characters
     """
+    print(render_strength_bar(score, width))
+
+
+def render_strength_bar(score: int, width: int = 40) -> str:
+    """
+    Render a visual strength bar
+    
+    Args:
+        score: Strength score (0-100)
+        width: Width of the bar in characters
+        
+    Returns:
+        Strength bar line, preceded by a blank line
+    """
     filled = int((score / 100) * width)
     bar = "█" * filled + "░" * (width - filled)
     
@@ -64,7 +122,7 @@ def display_strength_bar(score: int, width: int = 40) -> None:
     color = get_strength_color_code(score)
     reset = get_reset_color()
     
-    print(f"\nStrength Bar: {color}[{bar}] {score}%{reset}")
+    return f"\nStrength Bar: {color}[{bar}] {score}%{reset}"
 
 
 def get_strength_color_code(score: int) -> str:
@@ -77,22 +135,15 @@ def get_strength_color_code(score: int) -> str:
     Returns:
         ANSI color code string
     """
-    if not supports_color():
-        return ""
-    
-    if score >= 80:
-        return "\033[92m"  # Green
-    elif score >= 60:
-        return "\033[94m"  # Blue
-    elif score >= 40:
-        return "\033[93m"  # Yellow
-    else:
-        return "\033[91m"  # Red
+    for threshold, color in _STRENGTH_COLORS:
+        if score >= threshold:
+            return color
+    return _RED
 
 
 def get_reset_color() -> str:
     """Get ANSI reset color code"""
-    return "\033[0m" if supports_color() else ""
+    return _RESET
 
 
 def supports_color() -> bool:
@@ -108,7 +159,7 @@ def supports_color() -> bool:
     
     # Check for common environment variables
     term = os.environ.get('TERM', '').lower()
-    if 'color' in term or 'ansi' in term or term in ['xterm', 'xterm-256color', 'screen']:
+    if 'color' in term or 'ansi' in term or term in _COLOR_TERMS:
         return True
     
     # Windows command prompt usually doesn't support colors
@@ -118,6 +169,17 @@ def supports_color() -> bool:
     return True
 
 
+# Color support and ANSI codes are resolved once at import
+_COLOR = supports_color()
+_RED = "\033[91m" if _COLOR else ""
+_RESET = "\033[0m" if _COLOR else ""
+_STRENGTH_COLORS = [
+    (80, "\033[92m" if _COLOR else ""),  # Green
+    (60, "\033[94m" if _COLOR else ""),  # Blue
+    (40, "\033[93m" if _COLOR else ""),  # Yellow
+]
+
+
 def get_user_input(prompt: str, hide_input: bool = False) -> str:
     """
     Get user input with optional password hiding
@@ -139,6 +201,19 @@ def get_user_input(prompt: str, hide_input: bool = False) -> str:
         sys.exit(0)
 
 
+def parse_comma_separated(text: str) -> List[str]:
+    """
+    Split comma-separated user input into stripped, non-empty items
+    
+    Args:
+        text: Comma-separated input text
+        
+    Returns:
+        List of items
+    """
+    return list(filter(None, map(str.strip, text.split(','))))
+
+
 def validate_file_path(file_path: str) -> bool:
     """
     Validate that a file path exists and is accessible
@@ -168,15 +243,11 @@ def format_file_size(size_bytes: int) -> str:
     if size_bytes == 0:
         return "0 B"
     
-    size_names = ["B", "KB", "MB", "GB"]
-    size = size_bytes
-    unit_index = 0
+    # Each unit covers 10 more bits of the size
+    unit_index = min(len(_SIZE_UNITS) - 1, max(0, (int(size_bytes).bit_length() - 1) // 10))
+    size = size_bytes / (1 << (unit_index * 10))
     
-    while size >= 1024 and unit_index < len(size_names) - 1:
-        size /= 1024
-        unit_index += 1
-    
-    return f"{size:.1f} {size_names[unit_index]}"
+    return f"{size:.1f} {_SIZE_UNITS[unit_index]}"
 
 
 def sanitize_filename(filename: str) -> str:
@@ -189,10 +260,8 @@ def sanitize_filename(filename: str) -> str:
     Returns:
         Sanitized filename
     """
-    # Remove or replace invalid characters
-    invalid_chars = '<>:"/\\|?*'
-    for char in invalid_chars:
-        filename = filename.replace(char, '_')
+    # Replace invalid characters
+    filename = filename.translate(_FILENAME_TABLE)
     
     # Remove leading/trailing whitespace and dots
     filename = filename.strip('. ')
@@ -213,18 +282,25 @@ def create_backup_filename(original_path: str) -> str:
         
     Returns:
         Backup filename that doesn't exist
+        
+    Raises:
+        FileExistsError: If every backup slot up to MAX_BACKUP_COUNTER is taken
     """
     if not os.path.exists(original_path):
         return original_path
     
     base, ext = os.path.splitext(original_path)
-    counter = 1
     
-    while True:
+    # Resume from the last counter handed out for this path, wrapping around once
+    start = _backup_counters.get(original_path, 1)
+    for counter in chain(range(start, MAX_BACKUP_COUNTER + 1), range(1, start)):
         backup_path = f"{base}_{counter}{ext}"
         if not os.path.exists(backup_path):
+            _backup_counters[original_path] = counter + 1
             return backup_path
-        counter += 1
+    
+    raise FileExistsError(f"No free backup filename for '{original_path}' "
+                          f"(tried {MAX_BACKUP_COUNTER} slots)")
 
 
 def print_banner(title: str, width: int = 60) -> None:
@@ -281,23 +357,36 @@ def calculate_entropy_simple(text: str) -> float:
     if not text:
         return 0.0
     
-    # Count character frequencies
-    char_counts = {}
-    for char in text:
-        char_counts[char] = char_counts.get(char, 0) + 1
-    
-    # Calculate entropy
-    import math
+    # Calculate entropy from character frequencies
+    log2 = _log2
     entropy = 0.0
     text_length = len(text)
     
-    for count in char_counts.values():
+    for count in Counter(text).values():
         probability = count / text_length
-        entropy -= probability * math.log2(probability)
+        entropy -= probability * log2(probability)
     
     return entropy
 
 
+def split_duration(seconds: float) -> Optional[Tuple[int, str]]:
+    """
+    Express a duration as a whole number of its largest fitting unit
+    
+    Args:
+        seconds: Duration in seconds
+        
+    Returns:
+        (count, unit name) tuple, or None for durations under 1 second
+    """
+    index = bisect.bisect_right(_TIME_BOUNDS, seconds) - 1
+    if index < 0:
+        return None
+    
+    size, name = TIME_UNITS[index]
+    return int(seconds / size), name
+
+
 def format_time_duration(seconds: float) -> str:
     """
     Format time duration in human-readable format
@@ -308,22 +397,12 @@ def format_time_duration(seconds: float) -> str:
     Returns:
         Formatted duration string
     """
-    if seconds < 1:
+    duration = split_duration(seconds)
+    if duration is None:
         return "Less than 1 second"
-    elif seconds < 60:
-        return f"{int(seconds)} second{'s' if seconds != 1 else ''}"
-    elif seconds < 3600:
-        minutes = int(seconds / 60)
-        return f"{minutes} minute{'s' if minutes != 1 else ''}"
-    elif seconds < 86400:
-        hours = int(seconds / 3600)
-        return f"{hours} hour{'s' if hours != 1 else ''}"
-    elif seconds < 31536000:
-        days = int(seconds / 86400)
-        return f"{days} day{'s' if days != 1 else ''}"
-    else:
-        years = int(seconds / 31536000)
-        return f"{years} year{'s' if years != 1 else ''}"
+    
+    count, name = duration
+    return f"{count} {name}{'s' if count != 1 else ''}"
 
 
 def is_common_password(password: str) -> bool:
@@ -336,15 +415,7 @@ def is_common_password(password: str) -> bool:
     Returns:
         True if it's a common password, False otherwise
     """
-    common_passwords = {
-        'password', '123456', '123456789', 'qwerty', 'abc123',
-        'password123', 'admin', 'letmein', 'welcome', 'monkey',
-        'dragon', 'master', 'hello', 'login', 'pass', 'shadow',
-        '12345', '1234', '12345678', 'football', 'baseball',
-        'trustno1', 'superman', 'batman', 'jordan', 'harley'
-    }
-    
-    return password.lower() in common_passwords
+    return password.lower() in COMMON_PASSWORDS
 
 
 # Test utility functions
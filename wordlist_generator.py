@@ -5,47 +5,155 @@ Generates wordlists for security testing based on user inputs
 
 import re
 import itertools
-from typing import List, Set, Dict, Any
+from collections import Counter, defaultdict
+from concurrent.futures import ProcessPoolExecutor
+from typing import Any, Dict, FrozenSet, Iterable, Iterator, List, Optional, Set
 from datetime import datetime, timedelta
 
 
+# Number of cleaned base words whose variations each WordlistGenerator keeps cached
+VARIATION_CACHE_SIZE = 256
+
+# Maximum number of word combinations added to a wordlist
+COMBINATION_LIMIT = 1000
+
+# Export buffer size, and words encoded per write when exporting
+EXPORT_BUFFER_SIZE = 1 << 20
+EXPORT_BATCH_WORDS = 16384
+
+# Distinct base words needed before variations are generated in worker processes
+PARALLEL_MIN_WORDS = 500
+
+# Characters stripped from words before generating variations
+_NONWORD_RE = re.compile(r'[^\w]')
+
+# Date formats recognised in date inputs, each with the separator a date
+# string must contain for the format to match
+_DATE_RES = [(separator, re.compile(p)) for separator, p in (
+    ('', r'(\d{4})'),  # Year
+    ('/', r'(\d{1,2})/(\d{1,2})/(\d{4})'),  # MM/DD/YYYY
+    ('-', r'(\d{1,2})-(\d{1,2})-(\d{4})'),  # MM-DD-YYYY
+    ('-', r'(\d{4})-(\d{1,2})-(\d{1,2})'),  # YYYY-MM-DD
+    ('.', r'(\d{1,2})\.(\d{1,2})\.(\d{4})'),  # MM.DD.YYYY
+)]
+
+# Character class bits used by the charset distribution
+_CLASS_LOWER = 1
+_CLASS_UPPER = 2
+_CLASS_DIGIT = 4
+_CLASS_SYMBOL = 8
+
+
+class _CharClassTable(dict):
+    """Maps each character to its class bits, classifying characters on first use"""
+    
+    def __missing__(self, char: str) -> int:
+        bits = ((_CLASS_LOWER if char.islower() else 0)
+                | (_CLASS_UPPER if char.isupper() else 0)
+                | (_CLASS_DIGIT if char.isdigit() else 0)
+                | (_CLASS_SYMBOL if not char.isalnum() else 0))
+        self[char] = bits
+        return bits
+
+
+_CHAR_CLASSES = _CharClassTable()
+
+
+def _charset_mask(word: str) -> int:
+    """Combine the class bits of every character in a word"""
+    # Fast path for ASCII letters and digits, answered by whole-string checks
+    if word.isascii() and word.isalnum():
+        if word.isdigit():
+            return _CLASS_DIGIT
+        if word.islower():
+            mask = _CLASS_LOWER
+        elif word.isupper():
+            mask = _CLASS_UPPER
+        else:
+            mask = _CLASS_LOWER | _CLASS_UPPER
+        return mask if word.isalpha() else mask | _CLASS_DIGIT
+    
+    mask = 0
+    for char in word:
+        mask |= _CHAR_CLASSES[char]
+    return mask
+
+
+# Simple leetspeak characters favoured by word scoring
+_SIMPLE_LEET_RE = re.compile(r'[@31057!]')
+
+
+# Per-process generator used by variation worker processes
+_GENERATOR = None
+
+
+def _init_worker():
+    """Build the generator once when a worker process starts"""
+    global _GENERATOR
+    _GENERATOR = WordlistGenerator()
+
+
+def _word_variations(word: str, include_leet: bool, include_years: bool) -> FrozenSet[str]:
+    """Generate the variations of a single base word in a worker process"""
+    return _GENERATOR._generate_word_variations(word, include_leet, include_years)
+
+
 class WordlistGenerator:
     """Generates custom wordlists based on personal information and common patterns"""
     
+    # Common number suffixes
+    common_numbers = ('1', '12', '123', '1234', '01', '001', '2024', '2025')
+    
+    # Common prefixes and suffixes
+    prefixes = ('', 'my', 'the', 'i', 'love')
+    suffixes = ('', '!', '!!', '123', '12', '1', '01', '001', '@', '#')
+    
+    # Leetspeak substitutions
+    leet_substitutions = {
+        'a': ('@', '4'),
+        'e': ('3',),
+        'i': ('1', '!'),
+        'o': ('0',),
+        's': ('5', '$'),
+        't': ('7',),
+        'l': ('1',),
+        'g': ('9',),
+        'b': ('6',)
+    }
+    
+    # Common separators
+    separators = ('', '_', '-', '.', '!', '@', '#')
+    
+    # Season and month variations
+    seasons = frozenset({'spring', 'summer', 'autumn', 'fall', 'winter'})
+    months = frozenset({'jan', 'feb', 'mar', 'apr', 'may', 'jun',
+                        'jul', 'aug', 'sep', 'oct', 'nov', 'dec',
+                        'january', 'february', 'march', 'april', 'june',
+                        'july', 'august', 'september', 'october', 'november', 'december'})
+    
     def __init__(self):
-        # Common number suffixes
-        self.common_numbers = ['1', '12', '123', '1234', '01', '001', '2024', '2025']
-        
         # Current and recent years
         current_year = datetime.now().year
         self.years = [str(year) for year in range(current_year - 50, current_year + 5)]
         
-        # Common prefixes and suffixes
-        self.prefixes = ['', 'my', 'the', 'i', 'love']
-        self.suffixes = ['', '!', '!!', '123', '12', '1', '01', '001', '@', '#']
-        
-        # Leetspeak substitutions
-        self.leet_substitutions = {
-            'a': ['@', '4'],
-            'e': ['3'],
-            'i': ['1', '!'],
-            'o': ['0'],
-            's': ['5', '$'],
-            't': ['7'],
-            'l': ['1'],
-            'g': ['9'],
-            'b': ['6']
-        }
+        # Matches any of the years favoured by word scoring
+        self._common_year_re = re.compile('|'.join(self.years[:10]))
+        
+        # Numbers and years appended to word combinations (limited for combinations)
+        self._combo_numbers = self.common_numbers[:3]
+        self._combo_years = tuple(self.years[:5])
         
-        # Common separators
-        self.separators = ['', '_', '-', '.', '!', '@', '#']
+        # Every (prefix, suffix) pair except the empty one (that is the base word)
+        self._affixes = [(prefix, suffix) for prefix in self.prefixes
+                         for suffix in self.suffixes if prefix or suffix]
         
-        # Season and month variations
-        self.seasons = ['spring', 'summer', 'autumn', 'fall', 'winter']
-        self.months = ['jan', 'feb', 'mar', 'apr', 'may', 'jun',
-                      'jul', 'aug', 'sep', 'oct', 'nov', 'dec',
-                      'january', 'february', 'march', 'april', 'may', 'june',
-                      'july', 'august', 'september', 'october', 'november', 'december']
+        # Every single-character substitution, for the simple leetspeak path
+        self._leet_pairs = tuple((char, sub) for char, subs in self.leet_substitutions.items()
+                                 for sub in subs)
+        
+        # Memoized variations keyed on (clean_word, include_leet, include_years),
+        # so repeated base words (within and across wordlists) are only expanded once
+        self._variation_cache = {}
     
     def generate_wordlist(self, **kwargs) -> List[str]:
         """
@@ -60,10 +168,19 @@ class WordlistGenerator:
             include_leet: Include leetspeak variations (default: True)
             include_combinations: Include word combinations (default: True)
             max_words: Maximum number of words to generate
+            jobs: Worker processes for variation generation (default: 1)
             
         Returns:
             List of generated words
         """
+        return list(self.iter_wordlist(**kwargs))
+    
+    def iter_wordlist(self, **kwargs) -> Iterator[str]:
+        """
+        Generate custom wordlist lazily, in the same order as generate_wordlist
+        
+        Accepts the same keyword arguments as generate_wordlist.
+        """
         names = kwargs.get('names', [])
         dates = kwargs.get('dates', [])
         pets = kwargs.get('pets', [])
@@ -72,6 +189,7 @@ class WordlistGenerator:
         include_leet = kwargs.get('include_leet', True)
         include_combinations = kwargs.get('include_combinations', True)
         max_words = kwargs.get('max_words', 10000)
+        jobs = kwargs.get('jobs', 1)
         
         wordlist = set()
         
@@ -85,47 +203,53 @@ class WordlistGenerator:
         date_words = self._process_dates(dates)
         base_words.extend(date_words)
         
-        # Generate variations for each base word
-        for word in base_words:
-            if not word:
-                continue
-                
-            # Add original word and variations
-            wordlist.update(self._generate_word_variations(word, include_leet, include_years))
+        # Generate variations for each distinct base word; variations ignore case
+        distinct_words = [word for word in dict.fromkeys(word.lower() for word in base_words) if word]
+        
+        if jobs > 1 and len(distinct_words) >= PARALLEL_MIN_WORDS:
+            # Spread the words over worker processes and merge their variations
+            with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker) as executor:
+                chunksize = max(1, len(distinct_words) // (jobs * 4))
+                for variations in executor.map(_word_variations, distinct_words,
+                                               itertools.repeat(include_leet),
+                                               itertools.repeat(include_years),
+                                               chunksize=chunksize):
+                    wordlist.update(variations)
+        else:
+            for word in distinct_words:
+                # Add original word and variations
+                wordlist.update(self._generate_word_variations(word, include_leet, include_years))
         
         # Add common combinations if requested
         if include_combinations and base_words:
             combinations = self._generate_combinations(base_words[:5], include_leet, include_years)
             wordlist.update(combinations)
         
-        # Convert to sorted list and limit size
-        final_wordlist = sorted(list(wordlist))
-        
-        if max_words and len(final_wordlist) > max_words:
+        # Convert to sorted list and limit size; the set is released before
+        # the words are streamed out so only one copy stays in memory
+        if max_words and len(wordlist) > max_words:
             # Prioritize shorter, more common variations
-            final_wordlist = self._prioritize_words(final_wordlist, max_words)
+            final_wordlist = self._prioritize_words(wordlist, max_words)
+        else:
+            final_wordlist = sorted(wordlist)
+        del wordlist
         
-        return final_wordlist
+        yield from final_wordlist
     
     def _process_dates(self, dates: List[str]) -> List[str]:
         """Process and extract date-related words"""
         date_words = []
         
         for date_str in dates:
-            if not date_str.strip():
+            date_str = date_str.strip()
+            if not date_str:
                 continue
                 
-            # Try to parse various date formats
-            date_formats = [
-                r'(\d{4})',  # Year
-                r'(\d{1,2})/(\d{1,2})/(\d{4})',  # MM/DD/YYYY
-                r'(\d{1,2})-(\d{1,2})-(\d{4})',  # MM-DD-YYYY
-                r'(\d{4})-(\d{1,2})-(\d{1,2})',  # YYYY-MM-DD
-                r'(\d{1,2})\.(\d{1,2})\.(\d{4})',  # MM.DD.YYYY
-            ]
-            
-            for pattern in date_formats:
-                matches = re.findall(pattern, date_str.strip())
+            # Try to parse various date formats, skipping those whose separator is absent
+            for separator, pattern in _DATE_RES:
+                if separator not in date_str:
+                    continue
+                matches = pattern.findall(date_str)
                 for match in matches:
                     if isinstance(match, tuple):
                         date_words.extend(match)
@@ -134,38 +258,43 @@ class WordlistGenerator:
         
         return [word for word in date_words if word.isdigit()]
     
-    def _generate_word_variations(self, word: str, include_leet: bool, include_years: bool) -> Set[str]:
+    def _generate_word_variations(self, word: str, include_leet: bool, include_years: bool) -> FrozenSet[str]:
         """Generate variations of a single word"""
-        variations = set()
-        
         # Clean the word
-        clean_word = re.sub(r'[^\w]', '', word.lower())
+        clean_word = _NONWORD_RE.sub('', word.lower())
         if not clean_word:
-            return variations
+            return frozenset()
+        
+        key = (clean_word, include_leet, include_years)
+        variations = self._variation_cache.get(key)
+        if variations is None:
+            if len(self._variation_cache) >= VARIATION_CACHE_SIZE:
+                self._variation_cache.clear()
+            variations = self._variation_cache[key] = self._generate_clean_word_variations(*key)
         
+        return variations
+    
+    def _generate_clean_word_variations(self, clean_word: str, include_leet: bool,
+                                        include_years: bool) -> FrozenSet[str]:
+        """Generate variations of a cleaned, lowercase word"""
         # Base word variations
-        variations.add(clean_word)
-        variations.add(clean_word.capitalize())
-        variations.add(clean_word.upper())
-        
-        # Add prefixes and suffixes
-        for prefix in self.prefixes:
-            for suffix in self.suffixes:
-                if prefix or suffix:  # Don't add empty prefix+suffix (already have base word)
-                    variations.add(f"{prefix}{clean_word}{suffix}")
-                    variations.add(f"{prefix}{clean_word.capitalize()}{suffix}")
-        
-        # Add numbers
-        for num in self.common_numbers:
-            variations.add(f"{clean_word}{num}")
-            variations.add(f"{clean_word.capitalize()}{num}")
-            variations.add(f"{num}{clean_word}")
-        
-        # Add years if requested
-        if include_years:
-            for year in self.years:
-                variations.add(f"{clean_word}{year}")
-                variations.add(f"{clean_word.capitalize()}{year}")
+        capitalized = clean_word.capitalize()
+        variations = {clean_word, capitalized, clean_word.upper()}
+        
+        # Words that don't change when capitalized (e.g. dates) only need one pass
+        forms = (clean_word,) if capitalized == clean_word else (clean_word, capitalized)
+        for form in forms:
+            # Add prefixes and suffixes
+            variations.update([prefix + form + suffix for prefix, suffix in self._affixes])
+            
+            # Add numbers
+            variations.update([form + num for num in self.common_numbers])
+            
+            # Add years if requested
+            if include_years:
+                variations.update([form + year for year in self.years])
+        
+        variations.update([num + clean_word for num in self.common_numbers])
         
         # Add leetspeak variations if requested
         if include_leet:
@@ -173,85 +302,77 @@ class WordlistGenerator:
             variations.update(leet_variations)
         
         # Remove empty strings and very short words
-        return {v for v in variations if len(v) >= 3}
+        variations.difference_update([v for v in variations if len(v) < 3])
+        return frozenset(variations)
     
     def _generate_leet_variations(self, word: str) -> Set[str]:
         """Generate leetspeak variations of a word"""
-        variations = set()
-        
-        # Generate all possible leetspeak combinations
-        leet_chars = []
-        for char in word.lower():
-            if char in self.leet_substitutions:
-                # Include original character and all substitutions
-                leet_chars.append([char] + self.leet_substitutions[char])
-            else:
-                leet_chars.append([char])
+        lower_word = word.lower()
         
         # Generate combinations (limit to reasonable number)
-        if len(leet_chars) <= 6:  # Prevent explosion of combinations
-            for combination in itertools.product(*leet_chars):
-                leet_word = ''.join(combination)
-                if leet_word != word.lower():  # Don't include original
-                    variations.add(leet_word)
-                    variations.add(leet_word.capitalize())
+        if len(lower_word) <= 6:  # Prevent explosion of combinations
+            # Grow every leetspeak spelling one character at a time, trying the
+            # original character and all its substitutions at each position
+            leet_words = ['']
+            for char in lower_word:
+                options = (char,) + self.leet_substitutions.get(char, ())
+                leet_words = [prefix + option for prefix in leet_words for option in options]
+            leet_words = set(leet_words)
         else:
-            # For longer words, just do simple substitutions
-            for char, subs in self.leet_substitutions.items():
-                for sub in subs:
-                    leet_word = word.lower().replace(char, sub)
-                    if leet_word != word.lower():
-                        variations.add(leet_word)
-                        variations.add(leet_word.capitalize())
+            # For longer words, just do simple substitutions of the characters present
+            leet_words = {lower_word.replace(char, sub)
+                          for char, sub in self._leet_pairs if char in lower_word}
         
-        return variations
+        # Don't include original
+        leet_words.discard(lower_word)
+        
+        return leet_words | {leet_word.capitalize() for leet_word in leet_words}
     
     def _generate_combinations(self, words: List[str], include_leet: bool, include_years: bool) -> Set[str]:
-        """Generate combinations of multiple words"""
-        combinations = set()
-        
+        """Generate combinations of multiple words (the first COMBINATION_LIMIT generated)"""
         if len(words) < 2:
-            return combinations
-        
-        # Generate 2-word combinations
-        for i, word1 in enumerate(words):
-            for j, word2 in enumerate(words):
-                if i != j:
-                    clean_word1 = re.sub(r'[^\w]', '', word1.lower())
-                    clean_word2 = re.sub(r'[^\w]', '', word2.lower())
-                    
-                    if not clean_word1 or not clean_word2:
-                        continue
-                    
-                    # Different separator combinations
-                    for sep in self.separators:
-                        combo = f"{clean_word1}{sep}{clean_word2}"
-                        combinations.add(combo)
-                        combinations.add(combo.capitalize())
-                        
-                        # Add with numbers
-                        for num in self.common_numbers[:3]:  # Limit for combinations
-                            combinations.add(f"{combo}{num}")
-                        
-                        # Add with years
-                        if include_years:
-                            for year in self.years[:5]:  # Limit for combinations
-                                combinations.add(f"{combo}{year}")
+            return set()
+        
+        # Insertion-ordered, so the limit keeps the earliest combinations
+        combinations = {}
+        
+        combo_suffixes = self._combo_numbers
+        if include_years:
+            combo_suffixes += self._combo_years
+        
+        # Clean each word once; words that clean to nothing are never combined
+        clean_words = [_NONWORD_RE.sub('', word.lower()) for word in words]
+        clean_words = [clean_word for clean_word in clean_words if clean_word]
+        
+        # Generate 2-word combinations (ordered pairs of distinct positions)
+        for clean_word1, clean_word2 in itertools.permutations(clean_words, 2):
+            # Stop generating once the limit is reached
+            if len(combinations) >= COMBINATION_LIMIT:
+                break
+            
+            # Different separator combinations
+            combos = [f"{clean_word1}{sep}{clean_word2}" for sep in self.separators]
+            combinations.update(dict.fromkeys(combos))
+            combinations.update(dict.fromkeys([combo.capitalize() for combo in combos]))
+            
+            # Add with numbers and years
+            combinations.update(dict.fromkeys([combo + suffix for combo in combos
+                                               for suffix in combo_suffixes]))
         
         # Limit combination size to prevent explosion
-        return set(list(combinations)[:1000])
+        return set(itertools.islice(combinations, COMBINATION_LIMIT))
     
-    def _prioritize_words(self, wordlist: List[str], max_words: int) -> List[str]:
-        """Prioritize words based on likelihood and common patterns"""
+    def _prioritize_words(self, wordlist: Iterable[str], max_words: int) -> List[str]:
+        """Prioritize words based on likelihood and common patterns (ties in alphabetical order)"""
+        has_common_year = self._common_year_re.search
+        find_leet = _SIMPLE_LEET_RE.findall
         
         def word_score(word):
-            score = 0
-            
             # Prefer shorter words (more likely to be used)
-            score += max(0, 20 - len(word))
+            score = max(0, 20 - len(word))
             
             # Prefer words with numbers at the end
-            if re.search(r'\d+$', word):
+            if word[-1].isdecimal():
                 score += 10
             
             # Prefer capitalized words
@@ -259,42 +380,55 @@ class WordlistGenerator:
                 score += 5
             
             # Prefer words with common years
-            for year in self.years[:10]:
-                if year in word:
-                    score += 15
-                    break
+            if has_common_year(word):
+                score += 15
             
             # Prefer words with simple leetspeak
-            leet_count = sum(1 for char in word if char in '@31057!')
+            leet_count = len(find_leet(word))
             score += min(leet_count * 3, 10)
             
             return score
         
-        # Sort by score (descending) and return top words
-        scored_words = [(word, word_score(word)) for word in wordlist]
-        scored_words.sort(key=lambda x: x[1], reverse=True)
+        # Group words by score; scores are small integers, so only the groups
+        # needed to reach max_words have to be sorted
+        words_by_score = defaultdict(list)
+        for word in wordlist:
+            words_by_score[word_score(word)].append(word)
+        
+        # Take groups by score (descending) and return top words
+        prioritized = []
+        for score in sorted(words_by_score, reverse=True):
+            prioritized.extend(sorted(words_by_score[score]))
+            if len(prioritized) >= max_words:
+                break
         
-        return [word for word, score in scored_words[:max_words]]
+        return prioritized[:max_words]
     
-    def export_wordlist(self, wordlist: List[str], filename: str) -> bool:
+    def export_wordlist(self, wordlist: Iterable[str], filename: str) -> Optional[int]:
         """
         Export wordlist to file
         
         Args:
-            wordlist: List of words to export
+            wordlist: Words to export
             filename: Output filename
             
         Returns:
-            True if successful, False otherwise
+            Number of bytes written if successful, None otherwise
         """
         try:
-            with open(filename, 'w', encoding='utf-8') as f:
-                for word in wordlist:
-                    f.write(f"{word}\n")
-            return True
+            bytes_written = 0
+            words = iter(wordlist)
+            
+            # Stream the words in batches, one join and one encode per batch, so
+            # a lazy wordlist is never held in memory as a whole
+            with open(filename, 'wb', buffering=EXPORT_BUFFER_SIZE) as f:
+                for batch in iter(lambda: list(itertools.islice(words, EXPORT_BATCH_WORDS)), []):
+                    bytes_written += f.write(("\n".join(batch) + "\n").encode('utf-8'))
+            
+            return bytes_written
         except Exception as e:
             print(f"Error exporting wordlist: {str(e)}")
-            return False
+            return None
     
     def get_wordlist_stats(self, wordlist: List[str]) -> Dict[str, Any]:
         """Get statistics about the generated wordlist"""
@@ -307,11 +441,13 @@ class WordlistGenerator:
                 'unique_words': 0
             }
         
-        lengths = [len(word) for word in wordlist]
+        # Separate C-level passes (map/sum/min/max/set) beat a fused Python loop here
+        total_words = len(wordlist)
+        lengths = list(map(len, wordlist))
         
         return {
-            'total_words': len(wordlist),
-            'avg_length': round(sum(lengths) / len(lengths), 2),
+            'total_words': total_words,
+            'avg_length': round(sum(lengths) / total_words, 2),
             'min_length': min(lengths),
             'max_length': max(lengths),
             'unique_words': len(set(wordlist)),
@@ -328,23 +464,20 @@ class WordlistGenerator:
             'with_symbols': 0
         }
         
-        for word in wordlist:
-            has_lower = any(c.islower() for c in word)
-            has_upper = any(c.isupper() for c in word)
-            has_digit = any(c.isdigit() for c in word)
-            has_symbol = any(not c.isalnum() for c in word)
-            
-            if has_lower and not has_upper:
-                distribution['lowercase_only'] += 1
-            elif has_upper and not has_lower:
-                distribution['uppercase_only'] += 1
-            elif has_lower and has_upper:
-                distribution['mixed_case'] += 1
+        # Count words per class mask, then fold the (at most 16) masks into the totals
+        for mask, count in Counter(map(_charset_mask, wordlist)).items():
+            case = mask & (_CLASS_LOWER | _CLASS_UPPER)
+            if case == _CLASS_LOWER:
+                distribution['lowercase_only'] += count
+            elif case == _CLASS_UPPER:
+                distribution['uppercase_only'] += count
+            elif case:
+                distribution['mixed_case'] += count
             
-            if has_digit:
-                distribution['with_numbers'] += 1
-            if has_symbol:
-                distribution['with_symbols'] += 1
+            if mask & _CLASS_DIGIT:
+                distribution['with_numbers'] += count
+            if mask & _CLASS_SYMBOL:
+                distribution['with_symbols'] += count
         
         return distribution
 